@@ -6,6 +6,7 @@ A Streamlit web application for document-based question answering using BERT.
 import streamlit as st
 from document_processor import DocumentProcessor
 from qa_engine import QAEngine
+import inspect
 import os
 
 # Page configuration
@@ -53,16 +54,29 @@ if 'document_text' not in st.session_state:
     st.session_state.document_text = None
 if 'document_name' not in st.session_state:
     st.session_state.document_name = None
-if 'qa_engine' not in st.session_state:
-    st.session_state.qa_engine = None
+if 'document_len' not in st.session_state:
+    st.session_state.document_len = 0
+if 'document_preview' not in st.session_state:
+    st.session_state.document_preview = None
 if 'qa_history' not in st.session_state:
     st.session_state.qa_history = []
 
 # Initialize processors
 @st.cache_resource
 def load_qa_engine():
-    """Load the QA engine (cached to avoid reloading)."""
-    return QAEngine()
+    """Load the QA engine (cached to avoid reloading) and warm it up."""
+    qa_engine = QAEngine()
+    qa_engine.warm_up()
+    return qa_engine
+
+def supported_answer_kwargs(qa_engine, **kwargs):
+    """
+    Drop kwargs the engine's answer_question doesn't accept. A cached engine
+    can predate the running code after a redeploy; filtering by signature
+    avoids a TypeError without ever clearing the cache and reloading the model.
+    """
+    params = inspect.signature(qa_engine.answer_question).parameters
+    return {key: value for key, value in kwargs.items() if key in params}
 
 def get_confidence_class(score):
     """Return CSS class based on confidence score."""
@@ -108,17 +122,25 @@ def main():
                         
                         st.session_state.document_text = text
                         st.session_state.document_name = uploaded_file.name
+                        # Precompute once: every widget interaction reruns this
+                        # script, and the preview caps what goes over the websocket
+                        st.session_state.document_len = len(text)
+                        st.session_state.document_preview = (
+                            text if len(text) <= 5000 else text[:5000] + "\n..."
+                        )
                         st.session_state.qa_history = []  # Clear history for new document
-                        
+
                         st.success(f"✅ Document '{uploaded_file.name}' loaded successfully!")
-                        st.info(f"📊 Document length: {len(text)} characters")
+                        st.info(f"📊 Document length: {st.session_state.document_len} characters")
                     except Exception as e:
                         st.error(f"❌ Error processing document: {str(e)}")
                         st.session_state.document_text = None
                         st.session_state.document_name = None
+                        st.session_state.document_len = 0
+                        st.session_state.document_preview = None
             else:
                 st.success(f"✅ Document '{uploaded_file.name}' is loaded")
-                st.info(f"📊 Document length: {len(st.session_state.document_text)} characters")
+                st.info(f"📊 Document length: {st.session_state.document_len} characters")
         
         # Document preview
         if st.session_state.document_text:
@@ -127,7 +149,7 @@ def main():
             with st.expander("View document content"):
                 st.text_area(
                     "Document Text",
-                    st.session_state.document_text,
+                    st.session_state.document_preview,
                     height=300,
                     disabled=True,
                     label_visibility="collapsed"
@@ -177,7 +199,6 @@ def main():
         
         if st.button("🔄 Reload Engine"):
             st.cache_resource.clear()
-            st.session_state.qa_engine = None
             st.success("Engine cache cleared. Reloading...")
             st.rerun()
             
@@ -223,38 +244,40 @@ def main():
         # Process question
         if ask_button or (question and question.strip()):
             if question and question.strip():
+                # Refinement streams in the UI below instead of blocking inside
+                # the engine, so the answer starts rendering as soon as Gemini
+                # produces its first tokens
+                stream_refinement = enhance_with_gemini and gemini_ready and not use_rlm
+
                 with st.spinner("🤔 Thinking..."):
-                    # Load QA engine
-                    if st.session_state.qa_engine is None:
-                        st.session_state.qa_engine = load_qa_engine()
-                    
-                    # Get answer
-                    try:
-                        result = st.session_state.qa_engine.answer_question(
-                            question=question,
-                            context=st.session_state.document_text,
+                    # The cached engine is shared across sessions; no per-session copy
+                    result = qa_engine.answer_question(
+                        question=question,
+                        context=st.session_state.document_text,
+                        **supported_answer_kwargs(
+                            qa_engine,
                             max_answer_length=max_answer_length,
-                            enhance_with_gemini=enhance_with_gemini,
+                            enhance_with_gemini=enhance_with_gemini and not stream_refinement,
                             use_rlm=use_rlm
                         )
-                    except TypeError:
-                        # Handle cached object mismatch (old engine version)
-                        st.cache_resource.clear()
-                        st.session_state.qa_engine = load_qa_engine()
-                        result = st.session_state.qa_engine.answer_question(
-                            question=question,
-                            context=st.session_state.document_text,
-                            max_answer_length=max_answer_length,
-                            enhance_with_gemini=enhance_with_gemini,
-                            use_rlm=use_rlm
+                    )
+
+                if stream_refinement and result['score'] > 0.05:
+                    stream_area = st.empty()
+                    with stream_area.container():
+                        refined = st.write_stream(
+                            qa_engine.stream_refinement(question, result['answer'])
                         )
-                    
-                    # Add to history
-                    st.session_state.qa_history.append({
-                        'question': question,
-                        'answer': result['answer'],
-                        'score': result['score']
-                    })
+                    stream_area.empty()  # History below shows the final answer
+                    if refined:
+                        result['answer'] = refined
+
+                # Add to history
+                st.session_state.qa_history.append({
+                    'question': question,
+                    'answer': result['answer'],
+                    'score': result['score']
+                })
         
         # Display Q&A history
         if st.session_state.qa_history:
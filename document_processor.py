@@ -5,10 +5,13 @@ Supports: PDF, TXT, DOCX
 """
 
 import os
+import re
 from typing import Optional
-import PyPDF2
+from pypdf import PdfReader
 from docx import Document
 
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 class DocumentProcessor:
     """Process and extract text from uploaded documents."""
@@ -44,14 +47,11 @@ class DocumentProcessor:
         except Exception as e:
             raise Exception(f"Error processing document: {str(e)}")
     
-    def _extract_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF file."""
-        text = ""
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-        return self._clean_text(text)
+    def _extract_from_pdf(self, source) -> str:
+        """Extract text from a PDF file path or file-like object."""
+        pdf_reader = PdfReader(source)
+        pages = [page.extract_text() or "" for page in pdf_reader.pages]
+        return self._clean_text("\n".join(pages))
     
     def _extract_from_txt(self, file_path: str) -> str:
         """Extract text from TXT file."""
@@ -59,16 +59,16 @@ class DocumentProcessor:
             text = file.read()
         return self._clean_text(text)
     
-    def _extract_from_docx(self, file_path: str) -> str:
-        """Extract text from DOCX file."""
-        doc = Document(file_path)
+    def _extract_from_docx(self, source) -> str:
+        """Extract text from a DOCX file path or file-like object."""
+        doc = Document(source)
         text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
         return self._clean_text(text)
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize extracted text."""
-        # Remove excessive whitespace
-        text = ' '.join(text.split())
+        # Remove excessive whitespace without building a full token list
+        text = _WHITESPACE_RE.sub(' ', text)
         return text.strip()
     
     def process_uploaded_file(self, uploaded_file) -> Optional[str]:
@@ -81,18 +81,18 @@ class DocumentProcessor:
         Returns:
             Extracted text as string
         """
-        # Save uploaded file temporarily
-        temp_path = f"temp_{uploaded_file.name}"
-        
+        # Extract directly from the in-memory upload; no temp file round-trip
+        file_ext = os.path.splitext(uploaded_file.name)[1].lower()
+
+        if file_ext not in self.supported_formats:
+            raise ValueError(f"Unsupported file format: {file_ext}. Supported formats: {self.supported_formats}")
+
         try:
-            with open(temp_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
-            
-            # Process the file
-            text = self.process_document(temp_path)
-            
-            return text
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+            if file_ext == '.pdf':
+                return self._extract_from_pdf(uploaded_file)
+            elif file_ext == '.txt':
+                return self._clean_text(uploaded_file.read().decode('utf-8'))
+            elif file_ext == '.docx':
+                return self._extract_from_docx(uploaded_file)
+        except Exception as e:
+            raise Exception(f"Error processing document: {str(e)}")